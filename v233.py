@@ -1,173 +1,505 @@
 #!/usr/bin/env python3
+import io
+import os
 import sys
 import math
-import csv
 import json
+import threading
 from functools import lru_cache
-from collections import namedtuple
+from collections import deque, namedtuple
+from dataclasses import dataclass, field
+from enum import IntEnum
 from datetime import datetime
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QLineEdit, QPushButton, QComboBox, QTabWidget,
-                             QGroupBox, QDoubleSpinBox, QSpinBox, QTextEdit, QCheckBox,
-                             QFileDialog, QMessageBox, QInputDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+                             QGroupBox, QDoubleSpinBox, QSpinBox, QTextEdit, QPlainTextEdit,
+                             QCheckBox, QFileDialog, QMessageBox, QInputDialog)
+from PyQt5.QtCore import Qt, QThread, QCoreApplication, QEvent, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+import numpy as np
+
+try:
+    from numba import njit, prange
+    from numba import config as numba_config
+    NUMBA_AVAILABLE = True
+    # Parallel kernels run on a worker thread; with TBB that hangs interpreter
+    # exit, so prefer the OpenMP and workqueue layers
+    numba_config.THREADING_LAYER_PRIORITY = ['omp', 'workqueue', 'tbb']
+except ImportError:  # Numba is optional; the kernels then run as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
 
 # Constants
 GRAVITY = 9.80665  # m/s^2
 EARTH_RADIUS = 6371000  # meters
 EARTH_ROTATION_RATE = 7.292115e-5  # rad/s
 SPEED_OF_SOUND = 343  # m/s at sea level
+MAX_FLIGHT_TIME = 120.0  # s, integration stops here if the round is still airborne
+ZERO_SWEEP_POINTS = 181  # launch angles tried (0-45 deg) before refining the zero
+DATA_PANE_ROWS = 100  # trajectory points listed on the Data tab
+DIVERGED_MESSAGE = "The trajectory diverged (non-finite position or velocity)"
+PRESETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'presets.json')
 
-class DragModel:
-    """Enhanced drag coefficient tables for standard models"""
-    @staticmethod
-    @lru_cache(maxsize=1000)
-    def G1(velocity):
-        """Standard projectile drag function with more detailed table"""
-        mach = velocity / SPEED_OF_SOUND
-        if mach > 4.0: return 0.45
-        elif mach > 3.0: return 0.42
-        elif mach > 2.5: return 0.40
-        elif mach > 2.0: return 0.38
-        elif mach > 1.5: return 0.35
-        elif mach > 1.2: return 0.33
-        elif mach > 1.0: return 0.31
-        elif mach > 0.9: return 0.30
-        elif mach > 0.8: return 0.29
-        elif mach > 0.7: return 0.28
-        elif mach > 0.6: return 0.27
-        else: return 0.25
+# Held while a parallel kernel runs: the workqueue threading layer aborts if two
+# threads launch parallel kernels at once
+PARALLEL_KERNEL_LOCK = threading.Lock()
 
-    @staticmethod
-    @lru_cache(maxsize=1000)
-    def G7(velocity):
-        """Long-range boat tail drag function with more detailed table"""
-        mach = velocity / SPEED_OF_SOUND
-        if mach > 4.0: return 0.38
-        elif mach > 3.0: return 0.36
-        elif mach > 2.5: return 0.34
-        elif mach > 2.0: return 0.32
-        elif mach > 1.5: return 0.30
-        elif mach > 1.2: return 0.28
-        elif mach > 1.0: return 0.26
-        elif mach > 0.9: return 0.25
-        elif mach > 0.8: return 0.24
-        elif mach > 0.7: return 0.23
-        elif mach > 0.6: return 0.22
-        else: return 0.21
+# Drag tables: ascending Mach breakpoints and the Cd used up to each one.
+# The extra trailing Cd applies above the last breakpoint.
+DRAG_TABLES = {
+    'G1': ((0.6, 0.7, 0.8, 0.9, 1.0, 1.2, 1.5, 2.0, 2.5, 3.0, 4.0),
+           (0.25, 0.27, 0.28, 0.29, 0.30, 0.31, 0.33, 0.35, 0.38, 0.40, 0.42, 0.45)),
+    'G7': ((0.6, 0.7, 0.8, 0.9, 1.0, 1.2, 1.5, 2.0, 2.5, 3.0, 4.0),
+           (0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.28, 0.30, 0.32, 0.34, 0.36, 0.38)),
+    'rocket': ((0.8, 1.0, 1.5, 2.0, 3.0),
+               (0.25, 0.30, 0.35, 0.40, 0.45, 0.50)),
+    'mortar': ((0.8, 1.0, 1.5),
+               (0.40, 0.45, 0.50, 0.55)),
+}
+DEFAULT_DRAG_COEFFICIENT = 0.3  # Used for models without a table
 
-    @staticmethod
-    @lru_cache(maxsize=1000)
-    def rocket(velocity):
-        """Drag coefficient for rockets"""
-        mach = velocity / SPEED_OF_SOUND
-        if mach > 3.0: return 0.50
-        elif mach > 2.0: return 0.45
-        elif mach > 1.5: return 0.40
-        elif mach > 1.0: return 0.35
-        elif mach > 0.8: return 0.30
-        else: return 0.25
+# Drag models offered for each projectile type
+DRAG_MODELS_BY_TYPE = {
+    'bullet': ['G1', 'G7'],
+    'rocket': ['rocket'],
+    'mortar': ['mortar'],
+}
 
-    @staticmethod
-    @lru_cache(maxsize=1000)
-    def mortar(velocity):
-        """Drag coefficient for mortar shells"""
-        mach = velocity / SPEED_OF_SOUND
-        if mach > 1.5: return 0.55
-        elif mach > 1.0: return 0.50
-        elif mach > 0.8: return 0.45
-        else: return 0.40
+# Drag tables resampled onto a uniform Mach grid for the compiled trajectory
+# kernel: cell k covers Mach (k, k + 1] / MACH_LUT_RESOLUTION, so the lookup is
+# a single multiply and index instead of a search. Every breakpoint falls on a
+# cell edge, so the lookup matches a search of DRAG_TABLES exactly.
+MACH_LUT_RESOLUTION = 100  # cells per Mach
+MACH_LUT_MAX = 5.0  # the last cell is used above this
 
+def _build_drag_lut(machs, cds):
+    """Sample a DRAG_TABLES entry at the centre of every Mach cell"""
+    centres = (np.arange(int(MACH_LUT_MAX * MACH_LUT_RESOLUTION)) + 0.5) / MACH_LUT_RESOLUTION
+    return np.asarray(cds, dtype=np.float64)[np.searchsorted(machs, centres, side='left')]
+
+DRAG_LUTS = {name: _build_drag_lut(machs, cds) for name, (machs, cds) in DRAG_TABLES.items()}
+
+class DragModelId(IntEnum):
+    """Row of a drag model in DRAG_LUT_STACK"""
+    G1 = 0
+    G7 = 1
+    ROCKET = 2
+    MORTAR = 3
+    DEFAULT = 4  # Models without a table: DEFAULT_DRAG_COEFFICIENT throughout
+
+DRAG_MODEL_IDS = {
+    'G1': DragModelId.G1,
+    'G7': DragModelId.G7,
+    'rocket': DragModelId.ROCKET,
+    'mortar': DragModelId.MORTAR,
+}
+DRAG_LUT_STACK = np.stack(
+    [DRAG_LUTS[name] for name in DRAG_MODEL_IDS]
+    + [np.full(len(DRAG_LUTS['G1']), DEFAULT_DRAG_COEFFICIENT)])
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Projectile:
-    def __init__(self, mass=0.01, diameter=0.01, drag_model='G7', velocity=800, 
-                 projectile_type='bullet', thrust_curve=None, burn_time=0):
-        self.mass = mass  # kg
-        self.diameter = diameter  # meters
-        self.drag_model = drag_model
-        self.velocity = velocity  # m/s
-        self.area = math.pi * (diameter/2)**2
-        self.projectile_type = projectile_type
-        self.thrust_curve = thrust_curve or {}
-        self.burn_time = burn_time
-        self.initial_mass = mass
-        
-    def drag_coefficient(self, velocity):
-        """Get drag coefficient based on current velocity"""
-        if self.drag_model == 'G1':
-            return DragModel.G1(velocity)
-        elif self.drag_model == 'G7':
-            return DragModel.G7(velocity)
-        elif self.drag_model == 'rocket':
-            return DragModel.rocket(velocity)
-        elif self.drag_model == 'mortar':
-            return DragModel.mortar(velocity)
-        else:
-            return 0.3  # Default for other models
-            
-    def get_thrust(self, time):
-        """Get current thrust based on thrust curve"""
-        if time > self.burn_time:
-            return 0
-        # Linear interpolation of thrust curve
-        times = sorted(self.thrust_curve.keys())
-        if time <= times[0]:
-            return self.thrust_curve[times[0]]
-        if time >= times[-1]:
-            return self.thrust_curve[times[-1]]
-            
-        for i in range(1, len(times)):
-            if time <= times[i]:
-                t0, t1 = times[i-1], times[i]
-                f0, f1 = self.thrust_curve[t0], self.thrust_curve[t1]
-                return f0 + (f1 - f0) * (time - t0) / (t1 - t0)
-        return 0
-        
-    def get_mass(self, time):
-        """Calculate current mass based on burn time"""
-        if self.projectile_type != 'rocket' or time > self.burn_time:
-            return self.mass
-        # Linear mass decrease during burn
-        return self.initial_mass - (self.initial_mass - self.mass) * (time / self.burn_time)
+    """Projectile parameters (immutable; the derived fields are set once)"""
+    mass: float = 0.01  # kg
+    diameter: float = 0.01  # meters
+    drag_model: str = 'G7'
+    velocity: float = 800  # m/s
+    projectile_type: str = 'bullet'
+    thrust_curve: dict = None  # time (s) -> thrust (N)
+    burn_time: float = 0
+    area: float = field(init=False)
+    initial_mass: float = field(init=False)
+    drag_model_id: DragModelId = field(init=False)
+    thrust_times: np.ndarray = field(init=False, repr=False)
+    thrust_vals: np.ndarray = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        thrust_curve = self.thrust_curve or {}
+        derived = {
+            'thrust_curve': thrust_curve,
+            'area': math.pi * (self.diameter/2)**2,
+            'initial_mass': self.mass,
+            'drag_model_id': DRAG_MODEL_IDS.get(self.drag_model, DragModelId.DEFAULT),
+            # Thrust curve as sorted arrays for the trajectory kernel
+            'thrust_times': np.array(sorted(thrust_curve) or [0.0], dtype=np.float64),
+        }
+        derived['thrust_vals'] = np.array(
+            [thrust_curve.get(t, 0.0) for t in derived['thrust_times']], dtype=np.float64)
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)  # Bypasses frozen=True
+
+@lru_cache(maxsize=1024)
+def _air_density(temperature, pressure, humidity, altitude):
+    """Improved air density calculation using CIPM-2007 equation
+
+    A plain function of the conditions so that lru_cache hits whenever they
+    repeat (a cache on the Environment method was keyed by instance).
+    """
+    temp_kelvin = temperature + 273.15
+    R = 287.058  # Specific gas constant for dry air, J/(kg·K)
+    
+    # Saturation vapor pressure (Magnus form, 17.2693882 = 7.5 * ln 10)
+    svp = 6.1078 * math.exp(17.2693882 * temperature / (temperature + 237.3))
+    
+    # Vapor pressure
+    vp = svp * humidity / 100
+    
+    # Enhanced air density calculation
+    density = ((pressure * 100) / (R * temp_kelvin)) * (1 - (0.378 * vp) / (pressure * 100))
+    
+    # Altitude adjustment
+    density *= math.exp(-altitude / 10000)
+    
+    return density
 
+@dataclass(frozen=True, slots=True, eq=False)
 class Environment:
-    def __init__(self, altitude=0, temperature=15, pressure=1013.25, humidity=50,
-                 wind_speed=0, wind_angle=0, coriolis=False, latitude=45):
-        self.altitude = altitude  # meters
-        self.temperature = temperature  # °C
-        self.pressure = pressure  # hPa
-        self.humidity = humidity  # %
-        self.wind_speed = wind_speed  # m/s
-        self.wind_angle = wind_angle  # degrees
-        self.coriolis = coriolis
-        self.latitude = latitude
-        self.air_density = self.calculate_air_density()
+    """Firing conditions (immutable; air_density is derived once)"""
+    altitude: float = 0  # meters
+    temperature: float = 15  # °C
+    pressure: float = 1013.25  # hPa
+    humidity: float = 50  # %
+    wind_speed: float = 0  # m/s
+    wind_angle: float = 0  # degrees
+    coriolis: bool = False
+    latitude: float = 45
+    air_density: float = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'air_density', self.calculate_air_density())
     
-    @lru_cache(maxsize=128)
     def calculate_air_density(self):
         """Improved air density calculation using CIPM-2007 equation"""
-        temp_kelvin = self.temperature + 273.15
-        R = 287.058  # Specific gas constant for dry air, J/(kg·K)
-        
-        # Saturation vapor pressure
-        svp = 6.1078 * 10**((7.5 * self.temperature) / (self.temperature + 237.3))
-        
-        # Vapor pressure
-        vp = svp * self.humidity / 100
-        
-        # Enhanced air density calculation
-        density = ((self.pressure * 100) / (R * temp_kelvin)) * (1 - (0.378 * vp) / (self.pressure * 100))
-        
-        # Altitude adjustment
-        density *= math.exp(-self.altitude / 10000)
-        
-        return density
+        return _air_density(self.temperature, self.pressure, self.humidity, self.altitude)
+
+# Trajectory kernel: plain functions of floats and 1-D float64 arrays so that
+# Numba can compile them (no dicts, no attribute access). error_model='numpy'
+# drops the per-division zero checks, so a degenerate shot yields inf/nan
+# like NumPy instead of raising out of a parallel batch; the callers check
+# their results are finite. With fastmath, Numba also vectorizes math calls
+# through Intel's SVML when the optional icc_rt package is installed.
+@njit(cache=True, fastmath=True, nogil=True, error_model='numpy')
+def _lut_lookup(cd_lut, mach):
+    """Drag coefficient for a Mach number from a DRAG_LUTS table"""
+    idx = int(math.ceil(mach * MACH_LUT_RESOLUTION)) - 1
+    if idx >= cd_lut.shape[0]:
+        idx = cd_lut.shape[0] - 1
+    elif idx < 0:
+        idx = 0
+    return cd_lut[idx]
+
+@njit(cache=True, fastmath=True, nogil=True, error_model='numpy')
+def _interp_clamped(xs, ys, x):
+    """Linear interpolation of ys over ascending xs, clamped at both ends"""
+    n = xs.shape[0]
+    if x <= xs[0]:
+        return ys[0]
+    if x >= xs[n - 1]:
+        return ys[n - 1]
+    lo = 0
+    hi = n - 1
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if xs[mid] < x:
+            lo = mid
+        else:
+            hi = mid
+    return ys[lo] + (ys[hi] - ys[lo]) * (x - xs[lo]) / (xs[hi] - xs[lo])
+
+@njit(cache=True, fastmath=True, nogil=True, error_model='numpy')
+def _derivative(x, y, vx, vy, t, thrust_cos, thrust_sin, mass, initial_mass, drag_k,
+                cd_lut, wind, motor, coriolis_param, spin_k):
+    """Right-hand side of the point-mass equations of motion
+    
+    wind is (wind_x, wind_y), motor is (burn_time, thrust_times, thrust_vals);
+    these, coriolis_param and spin_k are None when that force is off. Numba
+    compiles one kernel per combination and drops the terms for forces that
+    are None, so the common cases do no work for them.
+    """
+    v_rel_x = vx
+    v_rel_y = vy
+    if wind is not None:
+        v_rel_x = vx - wind[0]
+        v_rel_y = vy - wind[1]
+    v_rel = math.sqrt(v_rel_x * v_rel_x + v_rel_y * v_rel_y)
+    
+    # Mass decreases linearly while the motor burns
+    current_mass = mass
+    burning = False
+    if motor is not None:
+        burning = t < motor[0]
+        if burning:
+            current_mass = initial_mass - (initial_mass - mass) * (t / motor[0])
+    
+    # Velocity-dependent drag: |a| = drag_k * Cd * v^2 / m along -v_rel
+    drag_coeff = _lut_lookup(cd_lut, v_rel / SPEED_OF_SOUND)
+    drag_per_v = drag_k * drag_coeff * v_rel / current_mass
+    
+    ax = -drag_per_v * v_rel_x
+    ay = -GRAVITY - drag_per_v * v_rel_y
+    
+    # Thrust while the motor is burning
+    if motor is not None:
+        if burning:
+            thrust = _interp_clamped(motor[1], motor[2], t)
+            ax += (thrust * thrust_cos) / current_mass
+            ay += (thrust * thrust_sin) / current_mass
+    
+    # Coriolis effect
+    if coriolis_param is not None:
+        ax += coriolis_param * vy
+        ay -= coriolis_param * vx
+    
+    # Simplified spin drift model
+    if spin_k is not None:
+        ax += spin_k * v_rel * v_rel
+    
+    return vx, vy, ax, ay
+
+@njit(cache=True, fastmath=True, nogil=True, error_model='numpy')
+def _rk4_step(x, y, vx, vy, t, dt, thrust_cos, thrust_sin, mass, initial_mass, drag_k,
+              cd_lut, wind, motor, coriolis_param, spin_k):
+    """Advance the state (x, y, vx, vy) by one classical RK4 step"""
+    half = 0.5 * dt
+    k1x, k1y, k1vx, k1vy = _derivative(
+        x, y, vx, vy, t, thrust_cos, thrust_sin, mass, initial_mass, drag_k,
+        cd_lut, wind, motor, coriolis_param, spin_k)
+    k2x, k2y, k2vx, k2vy = _derivative(
+        x + half * k1x, y + half * k1y, vx + half * k1vx, vy + half * k1vy,
+        t + half, thrust_cos, thrust_sin, mass, initial_mass, drag_k,
+        cd_lut, wind, motor, coriolis_param, spin_k)
+    k3x, k3y, k3vx, k3vy = _derivative(
+        x + half * k2x, y + half * k2y, vx + half * k2vx, vy + half * k2vy,
+        t + half, thrust_cos, thrust_sin, mass, initial_mass, drag_k,
+        cd_lut, wind, motor, coriolis_param, spin_k)
+    k4x, k4y, k4vx, k4vy = _derivative(
+        x + dt * k3x, y + dt * k3y, vx + dt * k3vx, vy + dt * k3vy,
+        t + dt, thrust_cos, thrust_sin, mass, initial_mass, drag_k,
+        cd_lut, wind, motor, coriolis_param, spin_k)
+    
+    sixth = dt / 6.0
+    return (x + sixth * (k1x + 2 * k2x + 2 * k3x + k4x),
+            y + sixth * (k1y + 2 * k2y + 2 * k3y + k4y),
+            vx + sixth * (k1vx + 2 * k2vx + 2 * k3vx + k4vx),
+            vy + sixth * (k1vy + 2 * k2vy + 2 * k3vy + k4vy))
+
+@njit(cache=True, fastmath=True, nogil=True, error_model='numpy')
+def _integrate_into(trajectory, velocity, angle_rad, mass, initial_mass, drag_k,
+                    cd_lut, wind, motor, coriolis_param, spin_k,
+                    max_time_step, min_time_step, max_time):
+    """Integrate from launch to ground impact (or max_time) into a work buffer
+    
+    trajectory is an (M, 6) buffer that is replaced by a larger one if the
+    flight does not fit, or None to only follow the flight (the row storage
+    is then compiled out). Returns the buffer, the number of points (rows
+    filled, columns x, y, t, vx, vy, v) and the x of the last point.
+    """
+    buffer = trajectory  # Kept apart so Numba can prune the None checks below
+    n = 0
+    last_x = 0.0
+    
+    # Initial state
+    x, y = 0.0, 0.0
+    vx = velocity * math.cos(angle_rad)
+    vy = velocity * math.sin(angle_rad)
+    time = 0.0
+    
+    # RK4 integration with adaptive step size
+    while time < max_time:
+        # Save current point, with room left for a possible impact point
+        current_vel = math.sqrt(vx * vx + vy * vy)
+        if trajectory is not None:
+            if n + 2 > buffer.shape[0]:
+                grown = np.empty((2 * buffer.shape[0], 6))
+                grown[:n] = buffer[:n]
+                buffer = grown
+            buffer[n, 0] = x
+            buffer[n, 1] = y
+            buffer[n, 2] = time
+            buffer[n, 3] = vx
+            buffer[n, 4] = vy
+            buffer[n, 5] = current_vel
+        n += 1
+        last_x = x
+        
+        # Adaptive step size based on velocity
+        time_step = max(min_time_step,
+                        min(max_time_step,
+                            max_time_step * (1000 / max(100.0, current_vel))))
+        
+        # Thrust follows the velocity vector; its direction is held for the step
+        thrust_cos = 0.0
+        thrust_sin = 0.0
+        if motor is not None:
+            if current_vel > 0:
+                thrust_cos = vx / current_vel
+                thrust_sin = vy / current_vel
+            else:
+                thrust_cos = math.cos(angle_rad)
+                thrust_sin = math.sin(angle_rad)
+        
+        new_x, new_y, new_vx, new_vy = _rk4_step(
+            x, y, vx, vy, time, time_step, thrust_cos, thrust_sin, mass, initial_mass,
+            drag_k, cd_lut, wind, motor, coriolis_param, spin_k)
+        
+        # Ground impact: interpolate the zero crossing within the last step
+        if new_y < 0:
+            alpha = y / (y - new_y)
+            last_x = x + alpha * (new_x - x)
+            if trajectory is not None:
+                impact_vx = vx + alpha * (new_vx - vx)
+                impact_vy = vy + alpha * (new_vy - vy)
+                buffer[n, 0] = last_x
+                buffer[n, 1] = 0.0
+                buffer[n, 2] = time + alpha * time_step
+                buffer[n, 3] = impact_vx
+                buffer[n, 4] = impact_vy
+                buffer[n, 5] = math.sqrt(impact_vx * impact_vx + impact_vy * impact_vy)
+            n += 1
+            break
+        
+        x, y, vx, vy = new_x, new_y, new_vx, new_vy
+        time += time_step
+    
+    return buffer, n, last_x
+
+@njit(cache=True, fastmath=True, nogil=True, error_model='numpy')
+def _integrate_trajectory(velocity, angle_rad, mass, initial_mass, drag_k,
+                          cd_lut, wind, motor, coriolis_param, spin_k,
+                          max_time_step, min_time_step, max_time):
+    """Integrate from launch to ground impact (or max_time)
+    
+    Returns an (N, 6) float64 array with columns x, y, t, vx, vy, v.
+    """
+    trajectory, n, _ = _integrate_into(
+        np.empty((1024, 6)), velocity, angle_rad, mass, initial_mass, drag_k,
+        cd_lut, wind, motor, coriolis_param, spin_k,
+        max_time_step, min_time_step, max_time)
+    return trajectory[:n].copy()
+
+@njit(cache=True, fastmath=True, nogil=True, error_model='numpy', parallel=True)
+def _sweep_angles(angles_rad, velocity, mass, initial_mass, drag_k,
+                  cd_lut, wind, motor, coriolis_param, spin_k,
+                  max_time_step, min_time_step, max_time):
+    """Ground-impact distance for every launch angle, integrated in parallel"""
+    ranges = np.empty(angles_rad.shape[0])
+    for i in prange(angles_rad.shape[0]):
+        # Only the impact point is needed, so no trajectory rows are stored
+        _, _, ranges[i] = _integrate_into(
+            None, velocity, angles_rad[i], mass, initial_mass, drag_k,
+            cd_lut, wind, motor, coriolis_param, spin_k,
+            max_time_step, min_time_step, max_time)
+    return ranges
+
+@njit(cache=True, fastmath=True, nogil=True, error_model='numpy', parallel=True)
+def _integrate_batch(velocities, angle_rad, masses, drag_ks, model_ids, burn_times,
+                     thrust_times, thrust_vals, thrust_points, spin_ks, wind,
+                     coriolis_param, cd_luts, max_time_step, min_time_step, max_time):
+    """Ground-impact distance for a batch of projectiles, integrated in parallel
+    
+    Row i of every per-projectile array describes projectile i: model_ids holds
+    its DragModelId (its row of cd_luts, normally DRAG_LUT_STACK), the first
+    thrust_points[i] entries of thrust_times/thrust_vals its thrust curve (burn
+    time 0 for unpowered rounds) and spin_ks its spin drift coefficient (0 when
+    off). wind and coriolis_param are shared by the batch and None when off, as
+    in _derivative.
+    """
+    ranges = np.empty(velocities.shape[0])
+    for i in prange(velocities.shape[0]):
+        k = thrust_points[i]
+        motor = (burn_times[i], thrust_times[i, :k], thrust_vals[i, :k])
+        _, _, ranges[i] = _integrate_into(
+            None, velocities[i], angle_rad, masses[i], masses[i], drag_ks[i],
+            cd_luts[model_ids[i]], wind, motor, coriolis_param, spin_ks[i],
+            max_time_step, min_time_step, max_time)
+    return ranges
+
+def bracketed_secant(func, lo, hi, f_lo, f_hi, tol=1e-9, max_iter=50):
+    """Root of func between lo and hi, where f_lo and f_hi differ in sign
+    
+    Secant steps that keep the root bracketed (the Illinois variant of
+    regula falsi), so convergence is superlinear without leaving [lo, hi].
+    """
+    x = prev = lo
+    side = 0
+    for _ in range(max_iter):
+        x = (lo * f_hi - hi * f_lo) / (f_hi - f_lo)
+        fx = func(x)
+        if fx == 0 or abs(x - prev) < tol:
+            break
+        prev = x
+        if (fx > 0) == (f_hi > 0):
+            hi, f_hi = x, fx
+            if side == -1:
+                f_lo /= 2  # Same end moved twice; halve the stale one
+            side = -1
+        else:
+            lo, f_lo = x, fx
+            if side == 1:
+                f_hi /= 2
+            side = 1
+    return x
+
+def solve_zero_angle(velocity, kernel_args, zero_range):
+    """Low launch angle (radians) whose ground impact lands at zero_range
+    
+    Raises ValueError if zero_range is beyond the reach of the projectile or
+    the trajectories diverge.
+    """
+    step_args = (0.1, 0.001, MAX_FLIGHT_TIME)
+    
+    # Coarse sweep over the low-angle solutions, then refine the first crossing
+    angles = np.radians(np.linspace(0, 45, ZERO_SWEEP_POINTS))
+    with PARALLEL_KERNEL_LOCK:
+        ranges = _sweep_angles(angles, velocity, *kernel_args, *step_args)
+    if not np.isfinite(ranges).all():
+        raise ValueError(DIVERGED_MESSAGE)
+    if zero_range > ranges.max():
+        raise ValueError(f"Zero range is beyond the maximum range of {ranges.max():.1f}m")
+    
+    def miss(angle_rad):
+        _, _, impact_x = _integrate_into(None, velocity, angle_rad, *kernel_args, *step_args)
+        return impact_x - zero_range
+    
+    i = int(np.argmax(ranges >= zero_range))
+    if i == 0:
+        return angles[0]
+    angle = bracketed_secant(miss, angles[i - 1], angles[i],
+                             ranges[i - 1] - zero_range, ranges[i] - zero_range)
+    if not math.isfinite(angle):
+        raise ValueError(DIVERGED_MESSAGE)
+    return angle
+
+def decimate_trajectory(trajectory, max_points):
+    """Pick at most max_points evenly spaced rows, always keeping the first and last"""
+    n = len(trajectory)
+    if n <= max_points:
+        return trajectory
+    return trajectory[np.linspace(0, n - 1, max_points).round().astype(np.intp)]
+
+# Trajectory kernel arguments after the launch velocity and angle; wind, motor,
+# coriolis_param and spin_k are None when that force is off (see _derivative)
+KernelArgs = namedtuple('KernelArgs', [
+    'mass', 'initial_mass', 'drag_k', 'cd_lut', 'wind', 'motor',
+    'coriolis_param', 'spin_k'])
+
+# Positional arguments of BallisticCalculator._calculate_trajectory
+TrajectoryParams = namedtuple('TrajectoryParams', [
+    'mass', 'diameter', 'drag_model', 'velocity', 'angle', 'altitude',
+    'temperature', 'wind_speed', 'wind_angle', 'coriolis', 'latitude',
+    'projectile_type', 'thrust', 'burn_time', 'spin_drift', 'twist'])
 
 class CalculationThread(QThread):
     """Thread for performing trajectory calculations without freezing UI"""
-    finished = pyqtSignal(list)
+    finished = pyqtSignal(object)  # (N, 6) ndarray of trajectory points
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
     
@@ -178,12 +510,88 @@ class CalculationThread(QThread):
         
     def run(self):
         try:
-            result = self.calculator._calculate_trajectory(**self.params)
+            result = self.calculator._calculate_trajectory(*self.params)
+            if not np.isfinite(result).all():
+                raise ValueError(DIVERGED_MESSAGE)
             self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
 
+class ZeroAngleThread(QThread):
+    """Thread for the zero-angle search without freezing UI"""
+    finished = pyqtSignal(float)  # launch angle in degrees
+    error = pyqtSignal(str)
+    
+    def __init__(self, velocity, kernel_args, zero_range):
+        super().__init__()
+        self.velocity = velocity
+        self.kernel_args = kernel_args
+        self.zero_range = zero_range
+        
+    def run(self):
+        try:
+            angle_rad = solve_zero_angle(self.velocity, self.kernel_args, self.zero_range)
+            self.finished.emit(math.degrees(angle_rad))
+        except Exception as e:
+            self.error.emit(str(e))
+
+class PresetComparisonThread(QThread):
+    """Thread for integrating every preset at once without freezing UI"""
+    finished = pyqtSignal(object)  # ndarray of ground ranges, one per preset (nan if diverged)
+    error = pyqtSignal(str)
+    
+    def __init__(self, batch_args):
+        super().__init__()
+        self.batch_args = batch_args
+        
+    def run(self):
+        try:
+            with PARALLEL_KERNEL_LOCK:
+                ranges = _integrate_batch(*self.batch_args, 0.1, 0.001, MAX_FLIGHT_TIME)
+            # Diverged presets are reported per row unless none succeeded
+            if not np.isfinite(ranges).any():
+                raise ValueError(DIVERGED_MESSAGE)
+            self.finished.emit(ranges)
+        except Exception as e:
+            self.error.emit(str(e))
+
+class KernelWarmupThread(QThread):
+    """Compile (or load from the on-disk cache) the trajectory kernel off the UI thread
+    
+    The parallel kernels are left to the threads that run them, which take
+    PARALLEL_KERNEL_LOCK (the workqueue layer requires one launch at a time).
+    """
+    def run(self):
+        unpowered = KernelArgs(mass=0.01, initial_mass=0.01, drag_k=6e-5,
+                               cd_lut=DRAG_LUTS['G7'], wind=None, motor=None,
+                               coriolis_param=None, spin_k=None)
+        powered = unpowered._replace(motor=(1.0, np.zeros(1), np.zeros(1)))
+        try:
+            # The variants with every optional force off, as for the presets
+            for args in (unpowered, powered):
+                _integrate_trajectory(800.0, 0.1, *args, 0.1, 0.001, 1.0)
+        except Exception:
+            pass  # The first real calculation will report the error
+
+ABOUT_TEXT = """Advanced Ballistic Calculator\n
+Version 3.0\n
+Features:
+- Support for bullets, rockets, and mortars
+- 30+ built-in presets for various projectiles
+- Adaptive RK4 integration for accurate trajectory calculation
+- Real drag coefficient tables (G1, G7, rocket, mortar models)
+- Environmental factors (altitude, temperature, wind)
+- Coriolis effect calculation
+- Spin drift modeling
+- Rocket thrust curve simulation
+- Trajectory comparison
+- Threaded calculations for responsive UI\n
+Created for Kali Linux"""
+
 class BallisticCalculator(QMainWindow):
+    _DIALOG_OPTS = QFileDialog.Options()
+    _PRESETS = None  # See load_presets
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Advanced Ballistic Calculator")
@@ -191,196 +599,40 @@ class BallisticCalculator(QMainWindow):
         
         self.projectile = None
         self.environment = None
-        self.trajectory = []
-        self.previous_trajectories = []
+        self.trajectory = np.empty((0, 6))
+        self.previous_trajectories = deque(maxlen=3)  # Oldest dropped; one per previous_lines
         
         # Load presets
         self.presets = self.load_presets()
         
         self.init_ui()
         
+        # Compile the trajectory kernel before the first Calculate click
+        if NUMBA_AVAILABLE:
+            self.warmup_thread = KernelWarmupThread()
+            self.warmup_thread.start()
+        
     def load_presets(self):
-        """Load ammunition presets from JSON file or use defaults"""
-        default_presets = {
-            # Bullet presets (3)
-            "5.56mm NATO": {
-                "mass": 4.0, "diameter": 5.56, "drag_model": "G7", 
-                "velocity": 940, "type": "bullet"
-            },
-            "7.62x51mm NATO": {
-                "mass": 9.5, "diameter": 7.82, "drag_model": "G7", 
-                "velocity": 830, "type": "bullet"
-            },
-            "9mm Parabellum": {
-                "mass": 8.0, "diameter": 9.0, "drag_model": "G1", 
-                "velocity": 360, "type": "bullet"
-            },
-            
-            # Rocket Presets (25)
-            "107mm Rocket (MRL)": {
-                "mass": 18800, "diameter": 107, "drag_model": "rocket",
-                "velocity": 375, "type": "rocket", "burn_time": 1.2,
-                "thrust_curve": {0: 2000, 0.5: 1800, 1.0: 1500, 1.2: 0}
-            },
-            "122mm Grad Rocket": {
-                "mass": 66000, "diameter": 122, "drag_model": "rocket",
-                "velocity": 690, "type": "rocket", "burn_time": 1.8,
-                "thrust_curve": {0: 5000, 0.8: 4500, 1.5: 3500, 1.8: 0}
-            },
-            "227mm HIMARS (M31)": {
-                "mass": 90000, "diameter": 227, "drag_model": "rocket",
-                "velocity": 850, "type": "rocket", "burn_time": 2.5,
-                "thrust_curve": {0: 10000, 1.0: 8500, 2.0: 6000, 2.5: 0}
-            },
-            "70mm Hydra (M151)": {
-                "mass": 4500, "diameter": 70, "drag_model": "rocket",
-                "velocity": 450, "type": "rocket", "burn_time": 1.0,
-                "thrust_curve": {0: 1200, 0.5: 1000, 0.8: 800, 1.0: 0}
-            },
-            "80mm S-8 Rocket": {
-                "mass": 11500, "diameter": 80, "drag_model": "rocket",
-                "velocity": 600, "type": "rocket", "burn_time": 1.5,
-                "thrust_curve": {0: 3000, 0.7: 2500, 1.2: 1800, 1.5: 0}
-            },
-            "240mm S-24 Rocket": {
-                "mass": 235000, "diameter": 240, "drag_model": "rocket",
-                "velocity": 550, "type": "rocket", "burn_time": 3.0,
-                "thrust_curve": {0: 15000, 1.5: 12000, 2.5: 8000, 3.0: 0}
-            },
-            "127mm Zuni Rocket": {
-                "mass": 25000, "diameter": 127, "drag_model": "rocket",
-                "velocity": 720, "type": "rocket", "burn_time": 1.8,
-                "thrust_curve": {0: 6000, 0.9: 5000, 1.5: 3500, 1.8: 0}
-            },
-            "210mm TOS-1A": {
-                "mass": 173000, "diameter": 210, "drag_model": "rocket",
-                "velocity": 420, "type": "rocket", "burn_time": 2.8,
-                "thrust_curve": {0: 12000, 1.4: 10000, 2.3: 7000, 2.8: 0}
-            },
-            "300mm Smerch": {
-                "mass": 800000, "diameter": 300, "drag_model": "rocket",
-                "velocity": 900, "type": "rocket", "burn_time": 4.0,
-                "thrust_curve": {0: 30000, 2.0: 25000, 3.5: 15000, 4.0: 0}
-            },
-            "140mm BM-14": {
-                "mass": 40000, "diameter": 140, "drag_model": "rocket",
-                "velocity": 400, "type": "rocket", "burn_time": 1.7,
-                "thrust_curve": {0: 4500, 0.8: 3800, 1.4: 2500, 1.7: 0}
-            },
-            "200mm Oghab": {
-                "mass": 145000, "diameter": 200, "drag_model": "rocket",
-                "velocity": 650, "type": "rocket", "burn_time": 2.5,
-                "thrust_curve": {0: 11000, 1.2: 9000, 2.0: 6000, 2.5: 0}
-            },
-            "90mm RPG-7": {
-                "mass": 2200, "diameter": 90, "drag_model": "rocket",
-                "velocity": 300, "type": "rocket", "burn_time": 0.8,
-                "thrust_curve": {0: 800, 0.3: 700, 0.6: 500, 0.8: 0}
-            },
-            "130mm Type 63": {
-                "mass": 33000, "diameter": 130, "drag_model": "rocket",
-                "velocity": 420, "type": "rocket", "burn_time": 1.6,
-                "thrust_curve": {0: 4000, 0.8: 3500, 1.3: 2500, 1.6: 0}
-            },
-            "180mm ARS-180": {
-                "mass": 100000, "diameter": 180, "drag_model": "rocket",
-                "velocity": 580, "type": "rocket", "burn_time": 2.2,
-                "thrust_curve": {0: 9000, 1.1: 7500, 1.8: 5000, 2.2: 0}
-            },
-            "250mm Falaq-2": {
-                "mass": 200000, "diameter": 250, "drag_model": "rocket",
-                "velocity": 380, "type": "rocket", "burn_time": 3.2,
-                "thrust_curve": {0: 13000, 1.6: 11000, 2.7: 7000, 3.2: 0}
-            },
-            "160mm LAR-160": {
-                "mass": 110000, "diameter": 160, "drag_model": "rocket",
-                "velocity": 700, "type": "rocket", "burn_time": 2.0,
-                "thrust_curve": {0: 9500, 1.0: 8000, 1.7: 5500, 2.0: 0}
-            },
-            "290mm WS-1": {
-                "mass": 750000, "diameter": 290, "drag_model": "rocket",
-                "velocity": 850, "type": "rocket", "burn_time": 3.8,
-                "thrust_curve": {0: 28000, 1.9: 23000, 3.2: 14000, 3.8: 0}
-            },
-            "400mm Fajr-5": {
-                "mass": 915000, "diameter": 400, "drag_model": "rocket",
-                "velocity": 950, "type": "rocket", "burn_time": 4.5,
-                "thrust_curve": {0: 35000, 2.2: 29000, 3.8: 18000, 4.5: 0}
-            },
-            "120mm RAAD": {
-                "mass": 56000, "diameter": 120, "drag_model": "rocket",
-                "velocity": 550, "type": "rocket", "burn_time": 1.9,
-                "thrust_curve": {0: 7000, 0.9: 6000, 1.6: 4000, 1.9: 0}
-            },
-            "220mm Uragan": {
-                "mass": 280000, "diameter": 220, "drag_model": "rocket",
-                "velocity": 720, "type": "rocket", "burn_time": 2.7,
-                "thrust_curve": {0: 18000, 1.3: 15000, 2.2: 9000, 2.7: 0}
-            },
-            "330mm Pinaka": {
-                "mass": 276000, "diameter": 330, "drag_model": "rocket",
-                "velocity": 880, "type": "rocket", "burn_time": 3.5,
-                "thrust_curve": {0: 22000, 1.7: 18000, 2.9: 11000, 3.5: 0}
-            },
-            "170mm Lynx": {
-                "mass": 120000, "diameter": 170, "drag_model": "rocket",
-                "velocity": 650, "type": "rocket", "burn_time": 2.1,
-                "thrust_curve": {0: 10000, 1.0: 8500, 1.8: 5500, 2.1: 0}
-            },
-            "310mm ASTROS II": {
-                "mass": 595000, "diameter": 310, "drag_model": "rocket",
-                "velocity": 820, "type": "rocket", "burn_time": 3.7,
-                "thrust_curve": {0: 26000, 1.8: 21000, 3.1: 13000, 3.7: 0}
-            },
-            "350mm A-100": {
-                "mass": 800000, "diameter": 350, "drag_model": "rocket",
-                "velocity": 900, "type": "rocket", "burn_time": 4.2,
-                "thrust_curve": {0: 32000, 2.1: 27000, 3.6: 16000, 4.2: 0}
-            },
-            
-            # Mortar Presets (5)
-            "60mm M224": {
-                "mass": 1700, "diameter": 60, "drag_model": "mortar",
-                "velocity": 240, "type": "mortar"
-            },
-            "81mm M252": {
-                "mass": 4200, "diameter": 81, "drag_model": "mortar",
-                "velocity": 250, "type": "mortar"
-            },
-            "82mm 2B9 Vasilek": {
-                "mass": 3300, "diameter": 82, "drag_model": "mortar",
-                "velocity": 272, "type": "mortar"
-            },
-            "120mm M120": {
-                "mass": 13000, "diameter": 120, "drag_model": "mortar",
-                "velocity": 325, "type": "mortar"
-            },
-            "160mm M160": {
-                "mass": 41000, "diameter": 160, "drag_model": "mortar",
-                "velocity": 343, "type": "mortar"
-            },
-            "240mm 2S4 Tyulpan": {
-                "mass": 130000, "diameter": 240, "drag_model": "mortar",
-                "velocity": 365, "type": "mortar"
-            },
-            "52mm IMI": {
-                "mass": 1200, "diameter": 52, "drag_model": "mortar",
-                "velocity": 200, "type": "mortar"
-            },
-            "98mm L16": {
-                "mass": 4500, "diameter": 98, "drag_model": "mortar",
-                "velocity": 260, "type": "mortar"
-            },
-            "107mm M30": {
-                "mass": 12000, "diameter": 107, "drag_model": "mortar",
-                "velocity": 300, "type": "mortar"
-            },
-            "140mm M57": {
-                "mass": 21000, "diameter": 140, "drag_model": "mortar",
-                "velocity": 320, "type": "mortar"
-            }
-        }
-        return default_presets
+        """Load ammunition presets from presets.json, or start with none if it is unusable
+
+        The file is parsed once and shared by all windows; each window gets its
+        own copy so that presets saved in one do not appear in the others.
+        """
+        if BallisticCalculator._PRESETS is None:
+            try:
+                with open(PRESETS_PATH, encoding='utf-8') as f:
+                    presets = json.load(f)
+                # JSON object keys are strings; thrust curves are keyed by time
+                for preset in presets.values():
+                    if "thrust_curve" in preset:
+                        preset["thrust_curve"] = {float(t): thrust for t, thrust
+                                                  in preset["thrust_curve"].items()}
+            except (OSError, ValueError) as e:
+                QMessageBox.warning(self, "Presets Unavailable",
+                                    f"Could not load presets from {PRESETS_PATH}:\n{str(e)}")
+                presets = {}
+            BallisticCalculator._PRESETS = presets
+        return dict(BallisticCalculator._PRESETS)
     
     def init_ui(self):
         main_widget = QWidget()
@@ -441,6 +693,10 @@ class BallisticCalculator(QMainWindow):
         save_btn.clicked.connect(self.save_preset)
         preset_layout.addWidget(save_btn)
         
+        self.compare_btn = QPushButton("Compare Presets")
+        self.compare_btn.clicked.connect(self.compare_presets)
+        preset_layout.addWidget(self.compare_btn)
+        
         preset_group.setLayout(preset_layout)
         layout.addWidget(preset_group)
         
@@ -623,9 +879,9 @@ class BallisticCalculator(QMainWindow):
         self.zero_range_input.setValue(100)
         zero_layout.addWidget(self.zero_range_input)
         
-        zero_btn = QPushButton("Calculate Zero Angle")
-        zero_btn.clicked.connect(self.calculate_zero_angle)
-        zero_layout.addWidget(zero_btn)
+        self.zero_btn = QPushButton("Calculate Zero Angle")
+        self.zero_btn.clicked.connect(self.calculate_zero_angle)
+        zero_layout.addWidget(self.zero_btn)
         zero_group.setLayout(zero_layout)
         layout.addWidget(zero_group)
         
@@ -669,7 +925,8 @@ class BallisticCalculator(QMainWindow):
         data_group = QGroupBox("Trajectory Data")
         data_layout = QVBoxLayout()
         
-        self.data_text = QTextEdit()
+        # Plain-text widget: its line layout is far cheaper than QTextEdit's
+        self.data_text = QPlainTextEdit()
         self.data_text.setReadOnly(True)
         data_layout.addWidget(self.data_text)
         
@@ -686,6 +943,18 @@ class BallisticCalculator(QMainWindow):
         self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
         
+        # Persistent axes and lines; plot_trajectory updates them in place
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_title('Projectile Trajectory')
+        self.ax.set_xlabel('Distance (m)')
+        self.ax.set_ylabel('Height (m)')
+        self.ax.grid(True)
+        self.current_line, = self.ax.plot([], [], 'b-', linewidth=2, label='Current')
+        self.previous_lines = [
+            self.ax.plot([], [], '--', linewidth=1, label=f'Previous {i+1}',
+                         alpha=0.7, visible=False)[0]
+            for i in range(3)]
+        
         # Add navigation toolbar
         self.toolbar = NavigationToolbar(self.canvas, self)
         layout.addWidget(self.toolbar)
@@ -704,90 +973,237 @@ class BallisticCalculator(QMainWindow):
         type_lower = type_str.lower()
         self.rocket_group.setVisible(type_lower == "rocket")
         
-        # Update drag model options
-        self.drag_model_combo.clear()
-        if type_lower == "bullet":
-            self.drag_model_combo.addItems(['G1', 'G7'])
-        elif type_lower == "rocket":
-            self.drag_model_combo.addItems(['rocket'])
-        elif type_lower == "mortar":
-            self.drag_model_combo.addItems(['mortar'])
+        # Update drag model options (only when they change, and without a
+        # currentTextChanged per item)
+        models = DRAG_MODELS_BY_TYPE.get(type_lower, [])
+        combo = self.drag_model_combo
+        if [combo.itemText(i) for i in range(combo.count())] != models:
+            combo.blockSignals(True)
+            try:
+                combo.clear()
+                combo.addItems(models)
+            finally:
+                combo.blockSignals(False)
     
     def load_preset(self, preset_name):
         if preset_name == "Custom":
             return
             
         preset = self.presets[preset_name]
-        self.mass_input.setValue(preset["mass"])
-        self.diam_input.setValue(preset["diameter"])
+        proj_type = preset.get("type", "bullet")
+        
+        # Block signals during the bulk update so each setter doesn't fan out
+        widgets = [self.mass_input, self.diam_input, self.drag_model_combo,
+                   self.velocity_input, self.type_combo,
+                   self.burn_time_input, self.thrust_input]
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            for spin, value in self._preset_inputs(preset).items():
+                spin.setValue(value)
+            self.type_combo.setCurrentText(proj_type.capitalize())
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+        
+        # Update type-dependent UI once, then select the preset's drag model
+        # (update_projectile_type repopulates the drag model combo)
+        self.update_projectile_type(proj_type)
         self.drag_model_combo.setCurrentText(preset["drag_model"])
-        self.velocity_input.setValue(preset["velocity"])
-        
-        # Set projectile type and update UI
-        self.type_combo.setCurrentText(preset.get("type", "bullet").capitalize())
-        self.update_projectile_type(preset.get("type", "bullet"))
-        
-        # Set rocket-specific parameters if applicable
-        if preset.get("type") == "rocket":
-            self.burn_time_input.setValue(preset.get("burn_time", 1.0))
-            self.thrust_input.setValue(preset.get("thrust_curve", {}).get(0, 1000))
+    
+    def _preset_inputs(self, preset):
+        """Values load_preset puts in the spin boxes, keyed by spin box
+        
+        Rocket presets also set the burn time and, as the constant thrust, the
+        thrust curve's value at launch.
+        """
+        inputs = {self.mass_input: preset["mass"],
+                  self.diam_input: preset["diameter"],
+                  self.velocity_input: preset["velocity"]}
+        if preset.get("type", "bullet") == "rocket":
+            inputs[self.burn_time_input] = preset.get("burn_time", 1.0)
+            inputs[self.thrust_input] = preset.get("thrust_curve", {}).get(0, 1000)
+        return inputs
+    
+    def _preset_params(self, preset, params):
+        """params as read_params would return them after loading preset
+        
+        The preset's values are clamped and rounded the way its spin boxes
+        store them, so a preset integrates here exactly as Calculate would
+        integrate it.
+        """
+        values = {spin: round(min(max(value, spin.minimum()), spin.maximum()), spin.decimals())
+                  for spin, value in self._preset_inputs(preset).items()}
+        return params._replace(
+            mass=values[self.mass_input] / 1000,  # g to kg
+            diameter=values[self.diam_input] / 1000,  # mm to m
+            drag_model=preset["drag_model"],
+            velocity=values[self.velocity_input],
+            projectile_type=preset.get("type", "bullet"),
+            thrust=values.get(self.thrust_input, params.thrust),
+            burn_time=values.get(self.burn_time_input, params.burn_time)
+        )
     
     def save_preset(self):
         name, ok = QInputDialog.getText(self, "Save Preset", "Preset name:")
         if ok and name:
+            proj_type = self.type_combo.currentText().lower()
             preset_data = {
                 "mass": self.mass_input.value(),
                 "diameter": self.diam_input.value(),
                 "drag_model": self.drag_model_combo.currentText(),
                 "velocity": self.velocity_input.value(),
-                "type": self.type_combo.currentText().lower()
+                "type": proj_type
             }
             
             # Add rocket-specific parameters if applicable
-            if self.type_combo.currentText().lower() == "rocket":
+            if proj_type == "rocket":
                 preset_data.update({
                     "burn_time": self.burn_time_input.value(),
                     "thrust_curve": {0: self.thrust_input.value()}
                 })
             
             self.presets[name] = preset_data
+            self.preset_combo.blockSignals(True)
             self.preset_combo.addItem(name)
+            self.preset_combo.blockSignals(False)
     
     def calculate_zero_angle(self):
         """Calculate the launch angle needed to hit at zero range"""
-        zero_range = self.zero_range_input.value()
-        # Simplified calculation - in reality would need iterative solution
-        angle = math.degrees(math.asin((zero_range * GRAVITY) / 
-                            (self.velocity_input.value() ** 2)) / 2)
+        self.zero_btn.setEnabled(False)
+        self.zero_btn.setText("Calculating...")
+        
+        params = self.read_params()
+        kernel_args = self._kernel_args(
+            params.mass, params.diameter, params.drag_model, params.altitude,
+            params.temperature, params.wind_speed, params.wind_angle,
+            params.coriolis, params.latitude, params.projectile_type,
+            params.thrust, params.burn_time, params.spin_drift, params.twist)
+        
+        self.zero_thread = ZeroAngleThread(params.velocity, kernel_args,
+                                           self.zero_range_input.value())
+        self.zero_thread.finished.connect(self.on_zero_angle_complete)
+        self.zero_thread.error.connect(self.on_zero_angle_error)
+        self.zero_thread.start()
+    
+    def compare_presets(self):
+        """Integrate every preset at the current angle and conditions in one batch"""
+        if not self.presets:
+            QMessageBox.information(self, "Preset Comparison", "No presets to compare.")
+            return
+        
+        self.compare_btn.setEnabled(False)
+        self.compare_btn.setText("Comparing...")
+        
+        params = self.read_params()
+        self.compare_angle = params.angle
+        self.compare_thread = PresetComparisonThread(self._preset_batch_args(params))
+        self.compare_thread.finished.connect(self.on_preset_comparison_complete)
+        self.compare_thread.error.connect(self.on_preset_comparison_error)
+        self.compare_thread.start()
+    
+    def _preset_batch_args(self, params):
+        """_integrate_batch arguments for all presets, in self.presets order
+        
+        Each preset goes through the same inputs and KernelArgs reduction as
+        Calculate after loading it.
+        """
+        preset_params = [self._preset_params(preset, params) for preset in self.presets.values()]
+        args = [self._kernel_args(
+                    p.mass, p.diameter, p.drag_model, p.altitude, p.temperature,
+                    p.wind_speed, p.wind_angle, p.coriolis, p.latitude,
+                    p.projectile_type, p.thrust, p.burn_time, p.spin_drift, p.twist)
+                for p in preset_params]
+        model_ids = np.array([DRAG_MODEL_IDS.get(p.drag_model, DragModelId.DEFAULT)
+                              for p in preset_params], dtype=np.intp)
+        
+        # Stack the per-preset values into rows; a missing motor becomes a
+        # zero burn time and a missing spin drift a zero coefficient
+        n = len(preset_params)
+        motors = [a.motor or (0.0, np.zeros(1), np.zeros(1)) for a in args]
+        thrust_points = np.array([len(m[1]) for m in motors], dtype=np.intp)
+        thrust_times = np.zeros((n, thrust_points.max()))
+        thrust_vals = np.zeros((n, thrust_points.max()))
+        for i, (_, times, vals) in enumerate(motors):
+            thrust_times[i, :len(times)] = times
+            thrust_vals[i, :len(vals)] = vals
+        return (np.array([p.velocity for p in preset_params], dtype=np.float64),
+                math.radians(params.angle),
+                np.array([a.mass for a in args]),
+                np.array([a.drag_k for a in args]),
+                model_ids,
+                np.array([m[0] for m in motors]),
+                thrust_times, thrust_vals, thrust_points,
+                np.array([a.spin_k or 0.0 for a in args]),
+                args[0].wind, args[0].coriolis_param, DRAG_LUT_STACK)
+    
+    def on_preset_comparison_complete(self, ranges):
+        self.compare_btn.setEnabled(True)
+        self.compare_btn.setText("Compare Presets")
+        results = list(zip(ranges, self.presets))
+        lines = [f"{name}: {rng:.1f} m" for rng, name in
+                 sorted(((rng, name) for rng, name in results if math.isfinite(rng)),
+                        reverse=True)]
+        lines += [f"{name}: failed (trajectory diverged)" for rng, name in results
+                  if not math.isfinite(rng)]
+        QMessageBox.information(
+            self, "Preset Comparison",
+            f"Range at {self.compare_angle:.1f}° launch angle:\n\n" + "\n".join(lines))
+    
+    def on_preset_comparison_error(self, error_msg):
+        self.compare_btn.setEnabled(True)
+        self.compare_btn.setText("Compare Presets")
+        QMessageBox.critical(self, "Error", f"Comparison failed:\n{error_msg}")
+    
+    def on_zero_angle_complete(self, angle):
+        self.zero_btn.setEnabled(True)
+        self.zero_btn.setText("Calculate Zero Angle")
         self.angle_input.setValue(angle)
         QMessageBox.information(self, "Zero Angle", 
                               f"Calculated zero angle: {angle:.2f}°")
     
+    def on_zero_angle_error(self, error_msg):
+        self.zero_btn.setEnabled(True)
+        self.zero_btn.setText("Calculate Zero Angle")
+        QMessageBox.warning(self, "Zero Angle", error_msg)
+    
+    def read_params(self):
+        """Collect the calculation inputs from the widgets
+        
+        The calculation threads only see this snapshot, never the widgets.
+        """
+        return TrajectoryParams(
+            mass=self.mass_input.value() / 1000,  # g to kg
+            diameter=self.diam_input.value() / 1000,  # mm to m
+            drag_model=self.drag_model_combo.currentText(),
+            velocity=self.velocity_input.value(),
+            angle=self.angle_input.value(),
+            altitude=self.altitude_input.value(),
+            temperature=self.temp_input.value(),
+            wind_speed=self.wind_speed_input.value(),
+            wind_angle=self.wind_angle_input.value(),
+            coriolis=self.coriolis_check.isChecked(),
+            latitude=self.latitude_input.value(),
+            projectile_type=self.type_combo.currentText().lower(),
+            thrust=self.thrust_input.value(),
+            burn_time=self.burn_time_input.value(),
+            spin_drift=self.spin_drift_check.isChecked(),
+            twist=self.twist_input.value()
+        )
+    
     def calculate_trajectory(self):
         # Disable UI during calculation
         self.calculate_btn.setEnabled(False)
         self.calculate_btn.setText("Calculating...")
         
         # Prepare parameters
-        params = {
-            "mass": self.mass_input.value() / 1000,  # g to kg
-            "diameter": self.diam_input.value() / 1000,  # mm to m
-            "drag_model": self.drag_model_combo.currentText(),
-            "velocity": self.velocity_input.value(),
-            "angle": self.angle_input.value(),
-            "altitude": self.altitude_input.value(),
-            "temperature": self.temp_input.value(),
-            "wind_speed": self.wind_speed_input.value(),
-            "wind_angle": self.wind_angle_input.value(),
-            "coriolis": self.coriolis_check.isChecked(),
-            "latitude": self.latitude_input.value()
-        }
+        params = self.read_params()
         
-        # Store previous trajectory for comparison
-        if self.trajectory:
-            self.previous_trajectories.append(self.trajectory)
-            if len(self.previous_trajectories) > 3:  # Keep last 3
-                self.previous_trajectories.pop(0)
+        # Store previous trajectory for comparison (thinned to its x, y columns
+        # in float32; it is only drawn as a faint overlay)
+        if len(self.trajectory):
+            self.previous_trajectories.append(
+                decimate_trajectory(self.trajectory[:, :2], 200).astype(np.float32))
         
         # Create and start thread
         self.calc_thread = CalculationThread(self, params)
@@ -800,8 +1216,11 @@ class BallisticCalculator(QMainWindow):
         self.calculate_btn.setEnabled(True)
         self.calculate_btn.setText("Calculate Trajectory")
         
-        if trajectory:
-            self.update_results()
+        if len(trajectory):
+            self.update_results(self.calc_thread.params)
+            # A new trajectory invalidates the toolbar's zoom/pan history;
+            # redraws such as toggling the comparison overlay keep it
+            self.toolbar.update()
             self.plot_trajectory()
         else:
             QMessageBox.warning(self, "Warning", "No trajectory data was generated")
@@ -813,17 +1232,30 @@ class BallisticCalculator(QMainWindow):
     
     def _calculate_trajectory(self, mass, diameter, drag_model, velocity, angle,
                             altitude, temperature, wind_speed, wind_angle,
-                            coriolis, latitude, max_time_step=0.1, min_time_step=0.001):
-        """Enhanced RK4 trajectory calculation with rocket/mortar support"""
+                            coriolis, latitude, projectile_type, thrust, burn_time,
+                            spin_drift, twist, max_time_step=0.1, min_time_step=0.001):
+        """Enhanced RK4 trajectory calculation with rocket/mortar support
+        
+        Returns an (N, 6) float64 array with columns x, y, t, vx, vy, v.
+        """
+        kernel_args = self._kernel_args(mass, diameter, drag_model, altitude, temperature,
+                                        wind_speed, wind_angle, coriolis, latitude,
+                                        projectile_type, thrust, burn_time, spin_drift, twist)
+        return _integrate_trajectory(velocity, math.radians(angle), *kernel_args,
+                                     max_time_step, min_time_step, MAX_FLIGHT_TIME)
+    
+    def _kernel_args(self, mass, diameter, drag_model, altitude, temperature,
+                     wind_speed, wind_angle, coriolis, latitude, projectile_type,
+                     thrust, burn_time, spin_drift, twist):
+        """Reduce the projectile and environment to the trajectory kernel's KernelArgs"""
         # Initialize projectile and environment
         projectile = Projectile(
             mass=mass,
             diameter=diameter,
             drag_model=drag_model,
-            velocity=velocity,
-            projectile_type=self.type_combo.currentText().lower(),
-            thrust_curve={0: self.thrust_input.value()},
-            burn_time=self.burn_time_input.value() if self.type_combo.currentText().lower() == "rocket" else 0
+            projectile_type=projectile_type,
+            thrust_curve={0: thrust},
+            burn_time=burn_time if projectile_type == "rocket" else 0
         )
         
         environment = Environment(
@@ -834,103 +1266,62 @@ class BallisticCalculator(QMainWindow):
             coriolis=coriolis,
             latitude=latitude
         )
-        
-        angle_rad = math.radians(angle)
-        wind_x = environment.wind_speed * math.cos(math.radians(environment.wind_angle))
-        wind_y = environment.wind_speed * math.sin(math.radians(environment.wind_angle))
-        
-        # Initial state: [x, y, vx, vy]
-        state = [0, 0, 
-                velocity * math.cos(angle_rad), 
-                velocity * math.sin(angle_rad)]
-        
-        trajectory = []
-        time = 0.0
-        
-        def derivative(s, t):
-            x, y, vx, vy = s
-            v_rel_x = vx - wind_x
-            v_rel_y = vy - wind_y
-            v_rel = math.hypot(v_rel_x, v_rel_y)
-            
-            # Get velocity-dependent drag coefficient
-            drag_coeff = projectile.drag_coefficient(v_rel)
-            drag_force = 0.5 * environment.air_density * v_rel**2 * drag_coeff * projectile.area
-            
-            # Acceleration components
-            ax = -(drag_force * v_rel_x) / (projectile.get_mass(t) * v_rel) if v_rel > 0 else 0
-            ay = -GRAVITY - (drag_force * v_rel_y) / (projectile.get_mass(t) * v_rel) if v_rel > 0 else -GRAVITY
-            
-            # Add thrust if rocket is still burning
-            if projectile.projectile_type == 'rocket' and t < projectile.burn_time:
-                thrust = projectile.get_thrust(t)
-                thrust_angle = angle_rad if t == 0 else math.atan2(vy, vx)  # Follow velocity vector
-                ax += (thrust * math.cos(thrust_angle)) / projectile.get_mass(t)
-                ay += (thrust * math.sin(thrust_angle)) / projectile.get_mass(t)
-            
-            # Coriolis effect
-            if environment.coriolis:
-                coriolis_param = 2 * EARTH_ROTATION_RATE * math.sin(math.radians(environment.latitude))
-                ax += coriolis_param * vy
-                ay -= coriolis_param * vx
-            
-            # Spin drift effect
-            if self.spin_drift_check.isChecked() and projectile.projectile_type == 'bullet':
-                twist_rate = self.twist_input.value() * 0.0254  # Convert inches to meters
-                spin_rate = (v_rel * 2 * math.pi) / twist_rate  # rad/s
-                spin_drift = 0.0001 * spin_rate * v_rel  # Simplified spin drift model
-                ax += spin_drift
-            
-            return [vx, vy, ax, ay]
-        
-        # RK4 integration with adaptive step size
-        while state[1] >= 0 and time < 120:  # Max 120 seconds flight time
-            # Save current point
-            trajectory.append((state[0], state[1], time, state[2], state[3], 
-                             math.hypot(state[2], state[3])))
-            
-            # Adaptive step size based on velocity
-            current_vel = math.hypot(state[2], state[3])
-            time_step = max(min_time_step, 
-                          min(max_time_step, 
-                              max_time_step * (1000 / max(100, current_vel))))
-            
-            # RK4 integration
-            k1 = derivative(state, time)
-            k2 = derivative([s + 0.5 * dt * k for s, k, dt in zip(state, k1, [time_step]*4)], time + 0.5*time_step)
-            k3 = derivative([s + 0.5 * dt * k for s, k, dt in zip(state, k2, [time_step]*4)], time + 0.5*time_step)
-            k4 = derivative([s + dt * k for s, k, dt in zip(state, k3, [time_step]*4)], time + time_step)
-            
-            for i in range(4):
-                state[i] += (time_step / 6.0) * (k1[i] + 2*k2[i] + 2*k3[i] + k4[i])
-            
-            time += time_step
-        
-        return trajectory
+        return self._reduce_kernel_args(projectile, environment, spin_drift, twist)
     
-    def update_results(self):
-        if not self.trajectory:
+    @staticmethod
+    def _reduce_kernel_args(projectile, environment, spin_drift, twist):
+        """KernelArgs for a Projectile fired in an Environment
+        
+        twist is the rifling twist in inches per revolution, used for spin
+        drift of bullets when spin_drift is set.
+        """
+        # Everything the kernel needs, reduced to floats and float64 arrays;
+        # forces that are off are passed as None so their terms compile out
+        wind = None
+        if environment.wind_speed:
+            wind_rad = math.radians(environment.wind_angle)
+            wind = (environment.wind_speed * math.cos(wind_rad),
+                    environment.wind_speed * math.sin(wind_rad))
+        cd_lut = DRAG_LUT_STACK[projectile.drag_model_id]
+        motor = None
+        if projectile.projectile_type == 'rocket' and projectile.burn_time > 0:
+            motor = (float(projectile.burn_time), projectile.thrust_times,
+                     projectile.thrust_vals)
+        coriolis_param = None
+        if environment.coriolis:
+            coriolis_param = 2 * EARTH_ROTATION_RATE * math.sin(math.radians(environment.latitude))
+        spin_k = None
+        if spin_drift and projectile.projectile_type == 'bullet':
+            twist_rate = twist * 0.0254  # Convert inches to meters
+            spin_k = 0.0001 * 2 * math.pi / twist_rate  # Drift accel = spin_k * v^2
+        drag_k = 0.5 * environment.air_density * projectile.area  # Drag force = drag_k*Cd*v^2
+        return KernelArgs(projectile.mass, projectile.initial_mass, drag_k, cd_lut,
+                          wind, motor, coriolis_param, spin_k)
+    
+    def update_results(self, params):
+        """Fill the summary and data panes; params are the inputs the trajectory used"""
+        if not len(self.trajectory):
             return
         
         # Calculate summary metrics
-        max_height = max(p[1] for p in self.trajectory)
-        distance = self.trajectory[-1][0]
-        flight_time = self.trajectory[-1][2]
-        impact_velocity = self.trajectory[-1][5]
-        impact_energy = 0.5 * (self.mass_input.value()/1000) * impact_velocity**2
+        max_height = self.trajectory[:, 1].max()
+        distance = self.trajectory[-1, 0]
+        flight_time = self.trajectory[-1, 2]
+        impact_velocity = self.trajectory[-1, 5]
+        impact_energy = 0.5 * params.mass * impact_velocity**2
         
         # Update summary text
         summary = f"""PROJECTILE:
-Type: {self.type_combo.currentText()}
-Mass: {self.mass_input.value():.1f}g
-Diameter: {self.diam_input.value():.1f}mm
-Drag Model: {self.drag_model_combo.currentText()}
-Muzzle Velocity: {self.velocity_input.value():.1f} m/s
-Launch Angle: {self.angle_input.value():.1f}°"""
+Type: {params.projectile_type.capitalize()}
+Mass: {params.mass * 1000:.1f}g
+Diameter: {params.diameter * 1000:.1f}mm
+Drag Model: {params.drag_model}
+Muzzle Velocity: {params.velocity:.1f} m/s
+Launch Angle: {params.angle:.1f}°"""
         
-        if self.type_combo.currentText().lower() == "rocket":
-            summary += f"\nBurn Time: {self.burn_time_input.value():.1f}s"
-            summary += f"\nAvg Thrust: {self.thrust_input.value():.0f}N"
+        if params.projectile_type == "rocket":
+            summary += f"\nBurn Time: {params.burn_time:.1f}s"
+            summary += f"\nAvg Thrust: {params.thrust:.0f}N"
         
         summary += f"""
         
@@ -943,89 +1334,75 @@ Impact Energy: {impact_energy:.1f}J"""
         
         self.summary_text.setPlainText(summary)
         
-        # Update detailed data
-        data_header = "Time(s)\tDistance(m)\tHeight(m)\tVx(m/s)\tVy(m/s)\tVelocity(m/s)\n"
-        data_lines = [data_header]
-        
-        for i, point in enumerate(self.trajectory):
-            if i % 10 == 0:  # Show every 10th point
-                data_lines.append(f"{point[2]:.3f}\t{point[0]:.1f}\t{point[1]:.1f}\t"
-                               f"{point[3]:.1f}\t{point[4]:.1f}\t{point[5]:.1f}\n")
-        
-        self.data_text.setPlainText(''.join(data_lines))
+        # Update detailed data (evenly spaced rows including launch and impact,
+        # formatted in one pass)
+        rows = decimate_trajectory(self.trajectory, DATA_PANE_ROWS)
+        data_text = io.StringIO()
+        np.savetxt(data_text, rows[:, [2, 0, 1, 3, 4, 5]],
+                   fmt=['%.3f', '%.1f', '%.1f', '%.1f', '%.1f', '%.1f'], delimiter='\t',
+                   header="Time(s)\tDistance(m)\tHeight(m)\tVx(m/s)\tVy(m/s)\tVelocity(m/s)",
+                   comments='')
+        self.data_text.setPlainText(data_text.getvalue())
     
     def plot_trajectory(self):
-        if not self.trajectory:
+        if not len(self.trajectory):
             return
         
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
         # Plot current trajectory
-        x = [p[0] for p in self.trajectory]
-        y = [p[1] for p in self.trajectory]
-        ax.plot(x, y, 'b-', linewidth=2, label='Current')
+        self.current_line.set_data(self.trajectory[:, 0], self.trajectory[:, 1])
         
         # Plot previous trajectories if comparison enabled
-        if self.compare_check.isChecked() and self.previous_trajectories:
-            for i, traj in enumerate(self.previous_trajectories):
-                x_prev = [p[0] for p in traj]
-                y_prev = [p[1] for p in traj]
-                ax.plot(x_prev, y_prev, '--', linewidth=1, 
-                       label=f'Previous {i+1}', alpha=0.7)
-        
-        ax.set_title('Projectile Trajectory')
-        ax.set_xlabel('Distance (m)')
-        ax.set_ylabel('Height (m)')
-        ax.grid(True)
-        ax.legend()
-        
-        self.canvas.draw()
+        show_previous = self.compare_check.isChecked()
+        for i, line in enumerate(self.previous_lines):
+            if show_previous and i < len(self.previous_trajectories):
+                traj = self.previous_trajectories[i]
+                line.set_data(traj[:, 0], traj[:, 1])
+                line.set_visible(True)
+            else:
+                line.set_visible(False)
+        
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale()
+        self.ax.legend(handles=[line for line in [self.current_line] + self.previous_lines
+                                if line.get_visible()])
+        self.canvas.draw_idle()
     
     def export_to_csv(self):
-        if not self.trajectory:
+        if not len(self.trajectory):
             QMessageBox.warning(self, "Warning", "No trajectory data to export")
             return
         
-        options = QFileDialog.Options()
         filename, _ = QFileDialog.getSaveFileName(
-            self, "Save CSV File", "", "CSV Files (*.csv)", options=options)
+            self, "Save CSV File", "", "CSV Files (*.csv)", options=self._DIALOG_OPTS)
         
         if filename:
             if not filename.endswith('.csv'):
                 filename += '.csv'
             
             try:
-                with open(filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(['Time(s)', 'Distance(m)', 'Height(m)', 
-                                    'Vx(m/s)', 'Vy(m/s)', 'Velocity(m/s)'])
-                    for point in self.trajectory:
-                        writer.writerow(point)
+                # Large write buffer: savetxt issues one write() per row
+                with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+                    # Reorder the x, y, t, ... columns to match the header
+                    np.savetxt(csvfile, self.trajectory[:, [2, 0, 1, 3, 4, 5]],
+                               fmt='%.10g', delimiter=',', comments='',
+                               header='Time(s),Distance(m),Height(m),'
+                                      'Vx(m/s),Vy(m/s),Velocity(m/s)')
                 
                 QMessageBox.information(self, "Success", f"Data exported to {filename}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
     
     def show_about(self):
-        about_text = """Advanced Ballistic Calculator\n
-Version 3.0\n
-Features:
-- Support for bullets, rockets, and mortars
-- 30+ built-in presets for various projectiles
-- Adaptive RK4 integration for accurate trajectory calculation
-- Real drag coefficient tables (G1, G7, rocket, mortar models)
-- Environmental factors (altitude, temperature, wind)
-- Coriolis effect calculation
-- Spin drift modeling
-- Rocket thrust curve simulation
-- Trajectory comparison
-- Threaded calculations for responsive UI\n
-Created for Kali Linux"""
-        QMessageBox.about(self, "About", about_text)
+        QMessageBox.about(self, "About", ABOUT_TEXT)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     calculator = BallisticCalculator()
     calculator.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    rc = app.exec_()
+    # Tear the widget tree down here rather than leaving it to the
+    # interpreter's shutdown collector (the connected lambdas keep the
+    # window referenced, so dropping the name alone would not free it)
+    calculator.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    sys.exit(rc)
\ No newline at end of file